@@ -1,13 +1,11 @@
 import os
-import dotenv
+import sys
+import threading
 import warnings
-from .env import Env
-from pathlib import Path
-from pydantic import BaseModel
-from pydantic.fields import FieldInfo
+from .env import Env, PlainEnv, make_error_model, DEFAULT_TYPE
+from .loader import cached_dotenv_values
 from .validations import ValidationOptions
-from pydantic.error_wrappers import ValidationError
-from typing import Iterable, Union, Dict, Optional, Sequence
+from typing import Iterable, Union, Dict, Sequence
 
 
 class BaseConfig:
@@ -34,21 +32,63 @@ class BaseConfig:
     eagerly_validate: bool = False
 
 
-class EnvMeta(type):
+class LazyInstance:
     """
-    Metaclass for populating env variables
-    as class attributes to the child class.
-    if the child class has a Config class, it will
+    Descriptor exposing the singleton instance of the env class.
+    The instance is only initialized on first access, and then replaces
+    this descriptor on the class, similar to `functools.cached_property`.
+    Initialization is guarded by a lock, so concurrent first access
+    creates a single instance. Accessing `instance` from within the
+    initialization of the same instance is not supported.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # thread creating the instance, to detect re-entry instead of deadlocking
+        self.initializing = None
+
+    def __get__(self, _, cls):
+        if self.initializing == threading.get_ident():
+            raise RuntimeError('instance accessed during initialization')
+        with self.lock:
+            instance_ = cls.__dict__.get('instance', self)
+            if instance_ is self:
+                self.initializing = threading.get_ident()
+                try:
+                    instance_ = cls()
+                finally:
+                    self.initializing = None
+                type.__setattr__(cls, 'instance', instance_)
+        return instance_
+
+
+class BaseEnv:
+    """
+    Base class for env variables
+    This can be used as a base class for env variables.
+    Env variables are populated as class attributes to the child class
+    when it is subclassed. if the child class has a Config class, it will
     be used to populate the env variables.
 
-    by default, the env variables are populated on first access
+    You would need to override the `Config` class with the following attributes:
+
+    - `envs`: Iterable[Union[tuple[str, str], str]] = List of env variables to be populated as class attributes.
+    - `dot_env_path`: Union[str, 'os.PathLike[str]'] = Path to the .env file to be loaded. By default,
+    it will load the .env file in the current directory.
+
+    > Note: `Config` class is optional. If not provided, it will not load any env variables.
+    `Config` class won't be available as an attribute on the child class.
+
+    raw values of the env variables are read from the .env file and `os.environ`
+    when the child class is defined. Changes to `os.environ` made afterwards are not picked up.
+    by default, the values are validated on first access
     and cached for subsequent access. This can be overriden by
     setting the value on the instance.
 
     if the env variable is not set, it uses the default value provided.
 
-    This class also initializes the instance of the child class and
-    make it available as `instance` attribute on the child class. So it can be accessed as
+    This class also exposes the instance of the child class as `instance` attribute
+    on the child class, initialized on first access. So it can be accessed as
     `ChildClass.instance`.
 
     Example:
@@ -59,52 +99,84 @@ class EnvMeta(type):
                 class Config(BaseConfig):
                     envs = ('dev', ('test', 'test_value'),
                             'prd', 'DB_HOST', 'DB_PORT')
-                    dot_env_path = Path(__file__).parent / '.env.test'
-
+                    # if not set, it will pick `.env`
+                    dot_env_path = Path(__file__).parent / '.env'
         >>> # access env variables
         >>> ABC.instance.dev
         >>> ABC.instance.test
         >>> ABC.instance.prd
+        >>> # override env variable
+        >>> ABC.instance.dev = 'dev_value'
     """
-    def __new__(mcs, name, bases, attrs: dict):
-        config_attrs = attrs.pop('Config', BaseConfig)  # type: BaseConfig
-        if config_attrs:
-            mcs.validate_envs(config_attrs)
-            mcs.validate_dotenv_path(config_attrs)
-            # loading env variables from file
-            dot_env_path = getattr(config_attrs, 'dot_env_path', None)
+    instance = LazyInstance()
+    __envs__ = {}
+    __resolved__ = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'instance' not in cls.__dict__:
+            # every subclass needs its own descriptor, so that
+            # it does not inherit the instance of its parent
+            cls.instance = LazyInstance()
+        config_attrs = cls.__dict__.get('Config', BaseConfig)  # type: BaseConfig
+        if 'Config' in cls.__dict__:
+            # Config class is not exposed on the child class
+            delattr(cls, 'Config')
+        cls.validate_envs(config_attrs)
+        cls.validate_dotenv_path(config_attrs)
+        # loading env variables from file
+        dot_env_path = getattr(config_attrs, 'dot_env_path', None)
+        # exported values do not override existing env variables,
+        # so those also take precedence while interpolating `${VAR}`
+        __contained__ = cached_dotenv_values(dot_env_path, override=config_attrs.contained)
+        if not config_attrs.contained:
+            # exporting the env variables, without overriding existing ones
+            os.environ.update({k: v for k, v in __contained__.items()
+                               if v is not None and k not in os.environ})
             __contained__ = {}
-            if not config_attrs.contained:
-                dotenv.load_dotenv(dot_env_path)
-            else:
-                __contained__ = dotenv.dotenv_values(dot_env_path)
-                if __contained__:
-                    attrs['__contained__'] = __contained__
-            # patching the class attrs with env variables
-            env_attr_ = mcs.process_config_attrs(config_attrs)
-            if config_attrs.eagerly_validate:
-                errs_ = []
-                name_space_, __annotations__ = {}, {}
-                for k, v in env_attr_.items():
-                    _, errors_ = v.validate(name, contained=__contained__)
-                    if errors_:
-                        name_space_[k] = FieldInfo(default=v.default, **v.extras)
-                        __annotations__[k] = v.type
-                        if isinstance(errors_, Sequence):
-                            errs_.extend(errors_)
-                        else:
-                            errs_.append(errors_)
-                name_space_['__annotations__'] = __annotations__
-                if errs_:
-                    raise ValidationError(errors=errs_,
-                                          model=type(name, (BaseModel,),
-                                                     name_space_))
-            attrs.update(env_attr_)
-        cls_ = super().__new__(mcs, name, bases, attrs)
-        # initializing the instance
-        cls_.instance = cls_()
-        return cls_
+        elif __contained__:
+            cls.__contained__ = __contained__
+        # patching the class attrs with env variables
+        env_attr_ = cls.process_config_attrs(config_attrs)
+        # resolving the raw values once, so descriptors only
+        # need a single attribute read on first access.
+        # looking up only the declared names is cheaper than
+        # snapshotting `os.environ`, which decodes every variable
+        contained_get_, environ_get_ = __contained__.get, os.environ.get
+        for k, v in env_attr_.items():
+            raw_ = contained_get_(k)
+            v.raw = environ_get_(k, v.default) if raw_ is None else raw_
+        if config_attrs.eagerly_validate:
+            errs_, fields_ = [], []
+            # plain env variables cannot fail validation
+            for v in env_attr_.values():
+                if type(v) is PlainEnv:
+                    continue
+                _, errors_ = v.validate(cls.__name__)
+                if errors_:
+                    fields_.append(v.error_field)
+                    if isinstance(errors_, Sequence):
+                        errs_.extend(errors_)
+                    else:
+                        errs_.append(errors_)
+            if errs_:
+                from pydantic.error_wrappers import ValidationError
+                raise ValidationError(errors=errs_,
+                                      model=make_error_model(cls.__name__, tuple(fields_)))
+        # inherited env variables, unless overridden by this class
+        overridden_ = cls.__dict__.keys() | env_attr_.keys()
+        __envs__ = {k: v for k, v in cls.__envs__.items() if k not in overridden_}
+        __envs__.update(env_attr_)
+        cls.__envs__ = __envs__
+        # plain env variables are already resolved, so they are
+        # prepopulated on the instance on initialization
+        __resolved__ = {k: v for k, v in cls.__resolved__.items() if k not in overridden_}
+        __resolved__.update((k, v.raw) for k, v in env_attr_.items() if type(v) is PlainEnv)
+        cls.__resolved__ = __resolved__
+        for k, v in env_attr_.items():
+            setattr(cls, k, v)
 
+    @staticmethod
     def validate_envs(config_attrs: BaseConfig):
         """
         Function to validate the config attributes
@@ -115,89 +187,100 @@ class EnvMeta(type):
         Raises:
             TypeError: If envs is not an iterable
         """
-        if not isinstance(config_attrs.envs, (tuple, list)):
-            raise TypeError('envs should be an iterable, either tuple or list')
+        if not isinstance(config_attrs.envs, (tuple, list, set, frozenset)):
+            raise TypeError('envs should be an iterable, either tuple, list or set')
 
+    @staticmethod
     def validate_dotenv_path(config_attrs: BaseConfig):
         """
         Function to validate the config attributes
 
         Args:
-            config_attrs (BaseConfig): _description_
+            config_attrs (BaseConfig): Attributes of the config class
 
         Raises:
-            FileNotFoundError: _description_
+            FileNotFoundError: If `dot_env_path` is not an existing file
         """
         if config_attrs.dot_env_path:
-            path_ = Path(config_attrs.dot_env_path)
-            if not path_.exists():
+            path_ = os.fspath(config_attrs.dot_env_path)
+            # probing up front avoids failing later while parsing,
+            # directories are not valid .env files either
+            if not os.path.isfile(path_):
                 raise FileNotFoundError(f'File not found at {path_}')
 
-    def process_config_attrs(config_attrs: BaseConfig) -> dict[str, Env]:
+    @classmethod
+    def process_config_attrs(cls, config_attrs: BaseConfig) -> dict[str, Env]:
         """
         Function to process the config attributes
         and prepare namespaced env variables
 
         Args:
-            config_attrs (BaseConfig): _description_
+            config_attrs (BaseConfig): Attributes of the config class
 
         Returns:
-            _type_: _description_
+            dict[str, Env]: env variables keyed by their name
         """
         validation_map = config_attrs.validations
-        default_type = Optional[str]
-        c_ = {}
-        for attr_name in getattr(config_attrs, 'envs', tuple()):
-            name_ = attr_name
-            default_ = None
-            if isinstance(attr_name, (tuple, list)):
-                [name_, default_] = attr_name
-            validation_kwargs = validation_map.get(name_, {})
-            default_ = default_ or validation_kwargs.pop('default', None)
-            # selecting the type of the env variable
-            required_ = validation_kwargs.get('required', False)
-            type_ = validation_kwargs.pop('type', default_type)
-            if required_ and type_ is default_type:
-                warnings.warn(
-                    f"Optional types cannot be required. {default_type}, will update required to False."
-                )
-                validation_kwargs['required'] = False
-            env_ = Env(default_, type_=type_, **validation_kwargs)
-            env_.__set_name__(None, name_)
-            c_[name_] = env_
-        return c_
-
-
-class BaseEnv(metaclass=EnvMeta):
-    """
-    Base class for env variables
-    This can be used as a base class for env variables.
+        envs_ = getattr(config_attrs, 'envs', tuple())
+        if isinstance(envs_, (set, frozenset)):
+            # sets are unordered, sorting by name keeps the class namespace
+            # and eager validation errors independent of hash order
+            envs_ = sorted(envs_, key=lambda a: a if type(a) is str else a[0])
+        return dict(cls.process_env(attr_name, validation_map)
+                    for attr_name in envs_)
 
-    You would need to override the `Config` class with the following attributes:
+    @staticmethod
+    def process_env(attr_name: Union[tuple[str, str], str],
+                    validation_map: Dict[str, ValidationOptions]) -> tuple[str, Env]:
+        """
+        Function to prepare a single named env variable
 
-    - `envs`: Iterable[Union[tuple[str, str], str]] = List of env variables to be populated as class attributes.
-    - `dot_env_path`: Union[str, 'os.PathLike[str]'] = Path to the .env file to be loaded. By default,
-    it will load the .env file in the current directory.
+        Args:
+            attr_name (typing.Union[tuple[str, str], str]): Element of `envs`, name or (name, default)
+            validation_map (typing.Dict[str, ValidationOptions]): validations of the config class
 
-    > Note: `Config` class is optional. If not provided, it will not load any env variables.
-    `Config` class won't be available as an attribute on the child class.
+        Returns:
+            tuple[str, Env]: name of the env variable and its descriptor
+        """
+        # plain names are the common case, so checking exact type first
+        if type(attr_name) is str or not isinstance(attr_name, (tuple, list)):
+            name_, default_ = attr_name, None
+        else:
+            [name_, default_] = attr_name
+        # interned names make dict lookups on the name a pointer comparison
+        name_ = sys.intern(name_)
+        if not validation_map.get(name_) and (default_ is None or type(default_) is str):
+            # without validations, Pydantic field options are not needed
+            env_ = PlainEnv(default_)
+            env_.__set_name__(None, name_)
+            return name_, env_
+        # copying, so the validations on the Config class are not mutated
+        validation_kwargs = dict(validation_map.get(name_, {}))
+        validation_default_ = validation_kwargs.pop('default', None)
+        if default_ is None:
+            default_ = validation_default_
+        # selecting the type of the env variable
+        required_ = validation_kwargs.get('required', False)
+        type_ = validation_kwargs.pop('type', DEFAULT_TYPE)
+        if required_ and type_ is DEFAULT_TYPE:
+            warnings.warn(
+                f"Optional types cannot be required. {DEFAULT_TYPE}, will update required to False."
+            )
+            validation_kwargs['required'] = False
+        env_ = Env(default_, type_=type_, **validation_kwargs)
+        if not env_.needs_validation and (default_ is None or type(default_) is str):
+            # plain string envs skip validation entirely on access
+            env_ = PlainEnv(default_)
+        env_.__set_name__(None, name_)
+        return name_, env_
 
-    Example:
+    def __init__(self):
+        # plain env variables shadow their descriptors from the start
+        self.__dict__.update(self.__resolved__)
 
-        >>> class ABC(BaseEnv):
-                def generate_uri(self):
-                    return f'{self.DB_HOST}:{self.DB_PORT}'
-                class Config(BaseConfig):
-                    envs = ('dev', ('test', 'test_value'),
-                            'prd', 'DB_HOST', 'DB_PORT')
-                    # if not set, it will pick `.env`
-                    dot_env_path = Path(__file__).parent / '.env'
-        >>> # access env variables
-        >>> ABC.instance.dev
-        >>> ABC.instance.test
-        >>> ABC.instance.prd
-        >>> # override env variable
-        >>> ABC.instance.dev = 'dev_value'
-    """
-    class Config(BaseConfig):
-        ...
+    def __setattr__(self, name, value):
+        # validating overridden env variables before caching them on the instance
+        env_ = self.__envs__.get(name)
+        if env_ is not None:
+            value = env_.get_validated_value(type(self).__name__, value=value)
+        super().__setattr__(name, value)
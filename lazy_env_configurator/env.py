@@ -1,24 +1,79 @@
-import os
-from pydantic.class_validators import Validator
-from pydantic.fields import ModelField, FieldInfo
-from typing import Dict, Optional, Type, Tuple, Any
-from pydantic.error_wrappers import ValidationError, ErrorList
-from pydantic import BaseConfig as PydanticBaseConfigModel, BaseModel
+import sys
+from functools import lru_cache
+from typing import Dict, Optional, Type, Tuple, Any, Hashable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Pydantic is imported lazily, only when an env needs validation
+    from pydantic import BaseModel
+    from pydantic.fields import ModelField
+    from pydantic.error_wrappers import ErrorList
+    from pydantic.class_validators import Validator
+
+# sentinel for values not passed explicitly, as falsy values are valid env values
+_UNSET = object()
+
+# type of env variables without a configured type
+DEFAULT_TYPE: Any = Optional[str]
+# name, type, default and options of a field in the error model
+ErrorField = Tuple[str, Type, Any, Tuple[Tuple[str, Hashable], ...]]
+# maximum number of validation errors memoised per env
+_ERRORS_CACHE_SIZE = 256
+
+
+def make_error_model(model_name: str,
+                     fields: Tuple[ErrorField, ...]) -> Type['BaseModel']:
+    """
+    Function to get the Pydantic model reported with a `ValidationError`.
+    Models are cached per shape, since creating Pydantic models is expensive.
+
+    Args:
+        model_name (str): name of the model, name of the env class
+        fields (tuple): fields of the model as returned by `Env.error_field`
+
+    Returns:
+        typing.Type[BaseModel]: model for the `ValidationError`
+    """
+    try:
+        hash(fields)
+    except TypeError:
+        # unhashable defaults or options cannot be cached
+        return _cached_error_model.__wrapped__(model_name, fields, ())
+    # `typed` only covers the arguments themselves, so the types of defaults
+    # and options are part of the key, e.g. `1` and `True` do not share a model
+    types_ = tuple((type(default_), tuple(type(v) for _, v in extras_))
+                   for _, _, default_, extras_ in fields)
+    return _cached_error_model(model_name, fields, types_)
+
+
+@lru_cache(maxsize=None, typed=True)
+def _cached_error_model(model_name: str,
+                        fields: Tuple[ErrorField, ...],
+                        _types: Tuple[Any, ...]) -> Type['BaseModel']:
+    from pydantic import BaseModel
+    from pydantic.fields import FieldInfo
+    name_space_, __annotations__ = {}, {}
+    for name_, type_, default_, extras_ in fields:
+        name_space_[name_] = FieldInfo(default=default_, **dict(extras_))
+        __annotations__[name_] = type_
+    name_space_['__annotations__'] = __annotations__
+    return type(model_name, (BaseModel,), name_space_)
 
 
 class Env(object):
     """
-    Env descriptor for env variables. This class populates env
-    variables on first access and caches the value for subsequent access.
+    Env descriptor for env variables. Raw value of the env variable is resolved
+    when the owning class is defined, this class validates it on first access
+    and caches the value on the instance for subsequent access.
     If the env variable is not set, it uses the default value provided.
-    Values can be overriden by setting the value on the instance.
+    Values can be overriden by setting the value on the instance, which are
+    validated by `BaseEnv.__setattr__`.
     """
-    __slots__ = ('name', 'value', 'default',
-                 '__calculated', 'type', 'validators',
-                 'required', 'extras')
+    __slots__ = ('name', 'default', 'raw', 'type', 'validators',
+                 'required', 'extras', 'needs_validation',
+                 '_validator_cache', '_errors_cache')
 
     def __init__(self, default=None,
-                 validators: Optional[Dict[str, Validator]] = None,
+                 validators: Optional[Dict[str, 'Validator']] = None,
                  type_: Type = None,
                  **kwargs):
         """
@@ -29,36 +84,45 @@ class Env(object):
             default (typing.Any, optional): Default to override in case of unset Env. Defaults to None.
         """
         self.name = None
-        self.value = None
         self.default = default
-        # flag to check if the value is already calculated
-        self.__calculated = False
+        # raw value of the env variable, resolved on class creation
+        self.raw = default
+        self._validator_cache = None
+        self._errors_cache = {}
         self.validators = validators
-        self.required = kwargs.pop("required", None) or default == Ellipsis
+        self.required = kwargs.pop("required", None) or default is Ellipsis
         self.type = type_
         self.extras = kwargs
+        # plain optional string envs without constraints
+        # can skip Pydantic validation for string values
+        self.needs_validation = bool(validators or kwargs or self.required) or \
+            type_ not in (None, DEFAULT_TYPE)
         # super().__init__(self.default, **kwargs)
 
     @property
-    def validator(self) -> ModelField:
-        # configuration Pydantic model
-        config = PydanticBaseConfigModel
-        config.fields = {self.name: self.extras}
-        default = ... if (self.default is Ellipsis or self.required) else self.default
-        m_ = ModelField.infer(
-            name=self.name,
-            value=default,
-            annotation=self.type,
-            class_validators=self.validators,
-            config=config,
-        )
-        return m_
+    def validator(self) -> 'ModelField':
+        # field shape is fixed once named, so the ModelField is built only once
+        if self._validator_cache is None:
+            from pydantic.fields import ModelField
+            from pydantic import BaseConfig as PydanticBaseConfigModel
+            # configuration Pydantic model, scoped to this env
+            config = type('Config', (PydanticBaseConfigModel,), {
+                'fields': {self.name: self.extras}
+            })
+            default = ... if (self.default is Ellipsis or self.required) else self.default
+            self._validator_cache = ModelField.infer(
+                name=self.name,
+                value=default,
+                annotation=self.type,
+                class_validators=self.validators,
+                config=config,
+            )
+        return self._validator_cache
 
     def validate(self, model: Optional[str],
                  *,
-                 value: Any = None,
-                 contained: dict = {}) -> Tuple[Any, Tuple[Optional[Any], Optional[ErrorList]]]:
-        val = value or (contained.get(self.name) or os.getenv(self.name, self.default))
+                 value: Any = _UNSET) -> Tuple[Any, Tuple[Optional[Any], Optional['ErrorList']]]:
+        val = self.raw if value is _UNSET else value
         v_, errors = self.validator.validate(val,
                                              {},
                                              loc=(model, self.name),
@@ -68,37 +132,66 @@ class Env(object):
     def __get__(self, instance, obj_type=None):
         '''
         descriptor __get__ method
+        Resolved value is cached on the instance `__dict__`,
+        which shadows this non data descriptor on subsequent access.
 
         Returns:
             typing.Any: value of the env variable
         '''
-        contained_ = getattr(instance, '__contained__', {})
-        # using the cached value if already calculated
-        if not self.__calculated:
-            instance_name_ = instance.__class__.__name__
-            v_ = self.get_validated_value(instance_name_,
-                                          contained=contained_)
-            self.value = v_
-            self.__calculated = True
-        return self.value
-
-    def get_validated_value(self, instance_name_: str, *, value: Any = None, contained: dict = {}):
-        v_, errors = self.validate(instance_name_, value=value, contained=contained)
-        if errors:
-            error = ValidationError(errors=[errors], model=type(instance_name_, (BaseModel,), {
-                self.name: FieldInfo(default=self.default, **self.extras),
-                "__annotations__": {self.name: self.type}
-            })
-            )
-            raise error
+        if instance is None:
+            return self
+        v_ = self.get_validated_value(type(instance).__name__)
+        instance.__dict__[self.name] = v_
         return v_
 
-    def __set__(self, instance, value):
-        val_ = self.get_validated_value(instance.__class__.__name__, value=value)
-        self.value = val_
-        # marking this as calculated
-        # otherwise this recalculates the value
-        self.__calculated = True
+    def get_validated_value(self, instance_name_: str, *, value: Any = _UNSET):
+        val = self.raw if value is _UNSET else value
+        if not self.needs_validation and (val is None or type(val) is str):
+            return val
+        # misconfigured envs fail with the same value on every read,
+        # so only the errors are memoised, valid values are never shared.
+        # keyed on type as well, so `1` and `True` are told apart
+        try:
+            key_ = (instance_name_, type(val), val)
+            cached_ = self._errors_cache.get(key_)
+        except TypeError:
+            # unhashable values cannot be memoised
+            key_ = cached_ = None
+        if cached_ is None:
+            v_, errors = self.validate(instance_name_, value=val)
+            if not errors:
+                return v_
+            cached_ = errors, make_error_model(instance_name_, (self.error_field,))
+            if key_ is not None:
+                if len(self._errors_cache) >= _ERRORS_CACHE_SIZE:
+                    # evicting the oldest entry keeps the cache bounded
+                    self._errors_cache.pop(next(iter(self._errors_cache)), None)
+                self._errors_cache[key_] = cached_
+        errors, model_ = cached_
+        # a new error per raise, so tracebacks are neither shared nor kept alive
+        from pydantic.error_wrappers import ValidationError
+        raise ValidationError(errors=[errors], model=model_)
+
+    @property
+    def error_field(self) -> ErrorField:
+        # hashable description of the field for `make_error_model`
+        return self.name, self.type, self.default, tuple(sorted(self.extras.items()))
 
     def __set_name__(self, _, name):
-        self.name = name
+        self.name = sys.intern(name)
+        self._validator_cache = None
+        self._errors_cache = {}
+
+
+class PlainEnv(Env):
+    """
+    Env descriptor for plain string env variables without validations.
+    Raw value of the env variable is cached on first access as is, skipping Pydantic.
+    """
+    __slots__ = ()
+
+    def __get__(self, instance, obj_type=None):
+        if instance is None:
+            return self
+        v_ = instance.__dict__[self.name] = self.raw
+        return v_
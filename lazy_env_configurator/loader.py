@@ -0,0 +1,38 @@
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
+
+
+def cached_dotenv_values(dot_env_path: Union[str, 'os.PathLike[str]'] = None,
+                         override: bool = True) -> Mapping[str, Optional[str]]:
+    """
+    Function to load values from the .env file.
+    Each file is parsed only once and reused until it is modified.
+
+    Args:
+        dot_env_path (typing.Union[str, 'os.PathLike[str]'], optional): Path to the .env file.
+            If not provided, `.env` file is searched for. Defaults to None.
+        override (bool, optional): If True, values in the file take precedence over
+            env variables while interpolating `${VAR}`. Defaults to True.
+
+    Returns:
+        Mapping[str, Optional[str]]: read only values parsed from the .env file
+    """
+    # deferring dotenv import keeps `import lazy_env_configurator` light
+    import dotenv
+    path_ = os.fspath(dot_env_path) if dot_env_path else dotenv.find_dotenv()
+    if not path_:
+        return MappingProxyType({})
+    path_ = os.path.realpath(path_)
+    return _parse_dotenv(path_, os.stat(path_).st_mtime, override)
+
+
+@lru_cache(maxsize=None)
+def _parse_dotenv(path_: str, mtime_: float, override: bool) -> Mapping[str, Optional[str]]:
+    # modification time is part of the key, so modified files are parsed again.
+    # values are shared between classes, hence exposed read only
+    # `dotenv_values` always lets the file win while interpolating,
+    # `DotEnv` is what both it and `load_dotenv` are built on
+    from dotenv.main import DotEnv
+    return MappingProxyType(DotEnv(path_, encoding='utf-8', override=override).dict())
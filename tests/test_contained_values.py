@@ -2,6 +2,8 @@ import os
 from pytest import warns
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
 from lazy_env_configurator import BaseConfig, BaseEnv
 from lazy_env_configurator.custom_warnings import EnvWarning
 
@@ -26,3 +28,15 @@ class TestInvalidEnv(TestCase):
 
     def test_is_contained(self):
         self.assertTrue(hasattr(self.t_, "__contained__"))
+
+    @patch.dict(os.environ, {"LAZY_ENV_EMPTY": "from_env"})
+    def test_empty_contained_value(self):
+        with TemporaryDirectory() as dir_:
+            path_ = Path(dir_) / ".env.empty"
+            path_.write_text('LAZY_ENV_EMPTY=""\n')
+
+            class EmptyValueEnv(BaseEnv):
+                class Config(BaseConfig):
+                    envs = (("LAZY_ENV_EMPTY", "default"),)
+                    dot_env_path = path_
+        self.assertEqual(EmptyValueEnv.instance.LAZY_ENV_EMPTY, "")
@@ -0,0 +1,27 @@
+from pathlib import Path
+from unittest import TestCase
+from lazy_env_configurator import BaseConfig, BaseEnv
+from lazy_env_configurator.loader import cached_dotenv_values
+
+
+class TestDotEnvCache(TestCase):
+
+    def test_dotenv_parsed_once(self):
+        class FirstEnv(BaseEnv):
+            class Config(BaseConfig):
+                envs = ("FOO",)
+                dot_env_path = Path(__file__).parent / ".env.contained"
+
+        class SecondEnv(BaseEnv):
+            class Config(BaseConfig):
+                envs = ("FOO",)
+                dot_env_path = str(Path(__file__).parent / ".env.contained")
+
+        self.assertIs(FirstEnv.__contained__, SecondEnv.__contained__)
+        self.assertEqual(SecondEnv.instance.FOO, "BAR")
+
+    def test_cached_values_read_only(self):
+        values_ = cached_dotenv_values(Path(__file__).parent / ".env.contained")
+        with self.assertRaises(TypeError):
+            values_["FOO"] = "changed"
+        self.assertEqual(values_["FOO"], "BAR")
@@ -1,10 +1,14 @@
 import os
+import time
+from threading import Thread
 from pathlib import Path
 from pytest import raises
 from unittest import TestCase
 from pydantic.errors import IntegerError
+from pydantic import BaseConfig as PydanticBaseConfig, Json
 from pydantic.error_wrappers import ValidationError
-from lazy_env_configurator import BaseEnv, BaseConfig
+from lazy_env_configurator import BaseEnv, BaseConfig, LazyInstance
+from lazy_env_configurator.env import Env, PlainEnv, make_error_model
 
 os.environ.setdefault('prd', 'prd_value')
 
@@ -60,6 +64,35 @@ class TestEnvMeta(TestCase):
         self.assertEqual(e.value.raw_errors[0].loc_tuple()[1], 'test_int')
         self.assertIn("value is not a valid integer", str(e.value))
 
+    def test_error_model_cached(self):
+        with raises(ValidationError) as first:
+            self.t_.test_int
+        with raises(ValidationError) as second:
+            self.t_.test_int
+        self.assertIs(first.value.model, second.value.model)
+        self.assertIs(first.value.raw_errors[0], second.value.raw_errors[0])
+        self.assertIsNot(first.value, second.value)
+
+    def test_error_model_typed(self):
+        int_model_ = make_error_model('Typed', (('x', int, 1, ()),))
+        bool_model_ = make_error_model('Typed', (('x', int, True, ()),))
+        self.assertIsNot(int_model_, bool_model_)
+        self.assertIs(bool_model_.__fields__['x'].default, True)
+        self.assertIs(make_error_model('Typed', (('x', int, 1, ()),)), int_model_)
+
+    def test_valid_value_not_shared(self):
+        class JsonEnv(BaseEnv):
+            class Config(BaseConfig):
+                envs = (('JCFG', '{"a": 1}'),)
+                validations = {
+                    'JCFG': {
+                        'type': Json,
+                    }
+                }
+        JsonEnv().JCFG['a'] = 999
+        self.assertEqual(JsonEnv().JCFG, {'a': 1})
+        self.assertIsNot(JsonEnv().JCFG, JsonEnv().JCFG)
+
     def test_invalid_dev_value(self):
         with raises(ValidationError) as e:
             self.t_.dev = "wow"
@@ -68,6 +101,13 @@ class TestEnvMeta(TestCase):
         self.assertIsInstance(e.value, ValidationError)
         self.assertIn("ensure this value has at least 5 characters", str(e.value))
 
+    def test_inherited_dev_value(self):
+        class ChildABC(ABC):
+            ...
+        with raises(ValidationError):
+            ChildABC().dev = "wow"
+        self.assertEqual(ChildABC().prd, 'prd_value')
+
     def test_valid_dev_value(self):
         self.t_.dev = "wowlength"
         # checking overwriting
@@ -76,6 +116,76 @@ class TestEnvMeta(TestCase):
     def test_test(self):
         self.assertEqual(self.t_.test, 'test_value')
 
+    def test_value_cached_on_instance(self):
+        self.assertEqual(self.t_.test, 'test_value')
+        self.assertEqual(self.t_.__dict__['test'], 'test_value')
+
+    def test_pydantic_config_not_mutated(self):
+        self.assertEqual(self.t_.DB_HOST, 'localhost')
+        self.assertEqual(PydanticBaseConfig.fields, {})
+
+    def test_falsy_value_override(self):
+        class FalsyEnv(BaseEnv):
+            class Config(BaseConfig):
+                envs = (('FALSY', 'falsy_default'),)
+        FalsyEnv.instance.FALSY = ''
+        self.assertEqual(FalsyEnv.instance.FALSY, '')
+
+    def test_env_is_slotted(self):
+        self.assertFalse(hasattr(Env(), '__dict__'))
+        self.assertFalse(hasattr(ABC.dev, '__dict__'))
+
+    def test_instance_is_lazy(self):
+        class LazyEnv(BaseEnv):
+            class Config(BaseConfig):
+                envs = ('dev',)
+
+        class ChildEnv(LazyEnv):
+            ...
+        self.assertIsInstance(LazyEnv.__dict__['instance'], LazyInstance)
+        self.assertIs(LazyEnv.instance, LazyEnv.instance)
+        self.assertIs(LazyEnv.__dict__['instance'], LazyEnv.instance)
+        self.assertIs(type(LazyEnv.instance), LazyEnv)
+        self.assertIs(type(ChildEnv.instance), ChildEnv)
+
+    def test_plain_env_selected(self):
+        self.assertIsInstance(ABC.prd, PlainEnv)
+        self.assertNotIsInstance(ABC.dev, PlainEnv)
+        self.assertNotIsInstance(ABC.test_int, PlainEnv)
+
+    def test_plain_env_prepopulated(self):
+        self.assertEqual(ABC().__dict__['prd'], 'prd_value')
+        self.assertNotIn('dev', ABC().__dict__)
+
+    def test_instance_thread_safe(self):
+        created_ = []
+
+        class SlowEnv(BaseEnv):
+            def __init__(self):
+                created_.append(self)
+                time.sleep(0.01)
+                super().__init__()
+
+        threads_ = [Thread(target=lambda: SlowEnv.instance) for _ in range(8)]
+        for thread_ in threads_:
+            thread_.start()
+        for thread_ in threads_:
+            thread_.join()
+        self.assertEqual(len(created_), 1)
+        self.assertIs(SlowEnv.instance, created_[0])
+
+    def test_instance_reentry(self):
+        class ReentrantEnv(BaseEnv):
+            def __init__(self):
+                super().__init__()
+                type(self).instance
+
+        with raises(RuntimeError, match='instance accessed during initialization'):
+            ReentrantEnv.instance
+        # failed initialization does not leave the descriptor locked
+        with raises(RuntimeError):
+            ReentrantEnv.instance
+
     def test_prd(self):
         self.assertEqual(self.t_.prd, 'prd_value')
 
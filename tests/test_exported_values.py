@@ -0,0 +1,47 @@
+import os
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from lazy_env_configurator import BaseConfig, BaseEnv
+
+
+class TestExportedEnv(TestCase):
+
+    @patch.dict(os.environ, {'LAZY_ENV_EXISTING': 'existing'})
+    def test_not_contained_env_file(self):
+        with TemporaryDirectory() as dir_:
+            path_ = Path(dir_) / '.env.exported'
+            path_.write_text('LAZY_ENV_EXPORTED="exported"\nLAZY_ENV_EXISTING="overridden"\n')
+
+            class ExportedEnv(BaseEnv):
+                class Config(BaseConfig):
+                    envs = ('LAZY_ENV_EXPORTED', 'LAZY_ENV_EXISTING')
+                    dot_env_path = path_
+                    contained = False
+
+        self.assertEqual(os.environ['LAZY_ENV_EXPORTED'], 'exported')
+        self.assertEqual(ExportedEnv.instance.LAZY_ENV_EXPORTED, 'exported')
+        self.assertEqual(ExportedEnv.instance.LAZY_ENV_EXISTING, 'existing')
+        self.assertFalse(hasattr(ExportedEnv.instance, '__contained__'))
+
+    @patch.dict(os.environ, {'LAZY_ENV_HOST': 'env-host'})
+    def test_interpolation_prefers_existing_env(self):
+        with TemporaryDirectory() as dir_:
+            path_ = Path(dir_) / '.env.interpolated'
+            path_.write_text('LAZY_ENV_HOST="file-host"\nLAZY_ENV_URL="http://${LAZY_ENV_HOST}"\n')
+
+            class ExportedEnv(BaseEnv):
+                class Config(BaseConfig):
+                    envs = ('LAZY_ENV_URL',)
+                    dot_env_path = path_
+                    contained = False
+
+            class ContainedEnv(BaseEnv):
+                class Config(BaseConfig):
+                    envs = ('LAZY_ENV_URL',)
+                    dot_env_path = path_
+
+        # matches `load_dotenv(override=False)` for exported values
+        self.assertEqual(ExportedEnv.instance.LAZY_ENV_URL, 'http://env-host')
+        self.assertEqual(ContainedEnv.instance.LAZY_ENV_URL, 'http://file-host')
@@ -11,3 +11,10 @@ class TestInvalidEnv(TestCase):
                 class Config(BaseConfig):
                     dot_env_path = Path(__file__).parent / "invalid_env_file.env"
         self.assertIn("File not found at", str(e.exception))
+
+    def test_directory_env_file(self):
+        with self.assertRaises(FileNotFoundError) as e:
+            class DirectoryEnv(BaseEnv):
+                class Config(BaseConfig):
+                    dot_env_path = Path(__file__).parent
+        self.assertIn("File not found at", str(e.exception))
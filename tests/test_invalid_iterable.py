@@ -12,3 +12,10 @@ class TestInvalidIterableEnv(TestCase):
                     envs = ('dev')
         self.assertIsInstance(e.exception, TypeError)
         self.assertIn("envs should be an iterable", str(e.exception))
+
+    def test_set_iterable_env(self):
+        class SetEnv(BaseEnv):
+            class Config(BaseConfig):
+                envs = {'prd', ('test', 'test_value'), 'dev'}
+        self.assertEqual(SetEnv.instance.test, 'test_value')
+        self.assertEqual(list(SetEnv.__envs__), ['dev', 'prd', 'test'])
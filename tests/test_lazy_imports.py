@@ -0,0 +1,12 @@
+import sys
+import subprocess
+from unittest import TestCase
+
+
+class TestLazyImports(TestCase):
+
+    def test_import_is_lazy(self):
+        code_ = ("import sys, lazy_env_configurator; "
+                 "print('pydantic' in sys.modules, 'dotenv' in sys.modules)")
+        out_ = subprocess.run([sys.executable, '-c', code_], capture_output=True, text=True, check=True)
+        self.assertEqual(out_.stdout.strip(), 'False False')